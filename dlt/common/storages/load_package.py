@@ -4,6 +4,7 @@ from copy import deepcopy
 import threading
 
 import datetime  # noqa: 251
+from functools import lru_cache
 import humanize
 from pathlib import PurePath
 from pendulum.datetime import DateTime
@@ -172,7 +173,9 @@ class ParsedLoadJobFileName(NamedTuple):
         return self._replace(retry_count=self.retry_count + 1)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse(file_name: str) -> "ParsedLoadJobFileName":
+        """Parses job file name or path. Results are cached, the same paths are parsed repeatedly during loading"""
         p = PurePath(file_name)
         parts = p.name.split(".")
         if len(parts) != 4:
@@ -1,5 +1,5 @@
 from os.path import join
-from typing import Iterable, List, Optional, Sequence
+from typing import FrozenSet, Iterable, List, Optional, Sequence
 
 from dlt.common.data_writers.exceptions import DataWriterNotFound
 from dlt.common.json import json
@@ -54,10 +54,17 @@ class LoadStorage(VersionedStorage):
         is_owner: bool,
         supported_file_formats: Iterable[TLoaderFileFormat],
         config: LoadStorageConfiguration = config.value,
+        internal_job_file_formats: Iterable[TJobFileFormat] = (),
     ) -> None:
         self.supported_loader_file_formats = supported_file_formats
-        # store job file formats to add internal job formats as needed
-        self.supported_job_file_formats: List[TJobFileFormat] = list(supported_file_formats)
+        # job file formats are loader file formats extended with internal job formats
+        self.supported_job_file_formats: List[TJobFileFormat] = [
+            *supported_file_formats,
+            *internal_job_file_formats,
+        ]
+        self._supported_job_file_formats: FrozenSet[TJobFileFormat] = frozenset(
+            self.supported_job_file_formats
+        )
         self.config = config
         super().__init__(
             LoadStorage.STORAGE_VERSION,
@@ -101,7 +108,8 @@ class LoadStorage(VersionedStorage):
             (
                 j
                 for j in new_jobs
-                if ParsedLoadJobFileName.parse(j).file_format not in self.supported_job_file_formats
+                if ParsedLoadJobFileName.parse(j).file_format
+                not in self._supported_job_file_formats
             ),
             None,
         )
@@ -1,5 +1,14 @@
 import dataclasses
-from typing import Final, ClassVar, Any, List, Dict
+from functools import lru_cache
+from typing import (
+    Final,
+    ClassVar,
+    Any,
+    List,
+    Dict,
+    FrozenSet,
+    Optional,
+)
 from dlt.common.libs.sql_alchemy_shims import URL
 
 from dlt.common.configuration import configspec
@@ -11,6 +20,19 @@ from dlt.common.exceptions import SystemConfigurationException
 from dlt.common.destination.reference import DestinationClientDwhWithStagingConfiguration
 
 
+@lru_cache(maxsize=1)
+def _available_drivers() -> FrozenSet[str]:
+    """Returns ODBC drivers registered in the driver manager. Enumeration is expensive so it is done once per process"""
+    import pyodbc
+
+    return frozenset(pyodbc.drivers())
+
+
+@lru_cache(maxsize=128)
+def _fingerprint_host(host: str) -> str:
+    return digest128(host)
+
+
 @configspec(init=False)
 class MsSqlCredentials(ConnectionStringCredentials):
     drivername: Final[str] = dataclasses.field(default="mssql", init=False, repr=False, compare=False)  # type: ignore
@@ -46,9 +68,8 @@ class MsSqlCredentials(ConnectionStringCredentials):
         self.database = self.database.lower()
 
     def get_query(self) -> Dict[str, Any]:
-        query = dict(super().get_query())
-        query["connect_timeout"] = self.connect_timeout
-        return query
+        # single dict build, the parsed query is never modified in place
+        return {**super().get_query(), "connect_timeout": self.connect_timeout}
 
     def on_partial(self) -> None:
         self.driver = self._get_driver()
@@ -60,18 +81,19 @@ class MsSqlCredentials(ConnectionStringCredentials):
             return self.driver
 
         # Pick a default driver if available
-        import pyodbc
-
-        available_drivers = pyodbc.drivers()
-        for d in self.SUPPORTED_DRIVERS:
-            if d in available_drivers:
-                return d
+        if driver := self._detect_driver():
+            return driver
         docs_url = "https://learn.microsoft.com/en-us/sql/connect/odbc/download-odbc-driver-for-sql-server?view=sql-server-ver16"
         raise SystemConfigurationException(
             f"No supported ODBC driver found for MS SQL Server.  See {docs_url} for information on"
             f" how to install the '{self.SUPPORTED_DRIVERS[0]}' on your platform."
         )
 
+    def _detect_driver(self) -> Optional[str]:
+        """Returns the first supported driver registered in the ODBC driver manager or None"""
+        available_drivers = _available_drivers()
+        return next((d for d in self.SUPPORTED_DRIVERS if d in available_drivers), None)
+
     def _get_odbc_dsn_dict(self) -> Dict[str, Any]:
         params = {
             "DRIVER": self.driver,
@@ -100,5 +122,5 @@ class MsSqlClientConfiguration(DestinationClientDwhWithStagingConfiguration):
     def fingerprint(self) -> str:
         """Returns a fingerprint of host part of a connection string"""
         if self.credentials and self.credentials.host:
-            return digest128(self.credentials.host)
+            return _fingerprint_host(self.credentials.host)
         return ""
@@ -1,8 +1,19 @@
 import contextlib
-from functools import reduce
-from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Sequence
-from concurrent.futures import Executor
+from functools import partial, reduce
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Set,
+    Iterator,
+    Iterable,
+    Sequence,
+)
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
 import os
+import time
 
 from dlt.common import logger
 from dlt.common.exceptions import TerminalException
@@ -19,6 +30,7 @@ from dlt.common.storages.load_storage import (
 )
 from dlt.common.storages.load_package import (
     LoadPackageStateInjectableContext,
+    TJobFileFormat,
     load_package as current_load_package,
 )
 from dlt.common.runners import TRunMetrics, Runnable, workermethod, NullExecutor
@@ -26,7 +38,10 @@ from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.logger import pretty_format_exception
 from dlt.common.configuration.container import Container
 from dlt.common.schema import Schema
+from dlt.common.schema.typing import TWriteDisposition
 from dlt.common.storages import LoadStorage
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
+from dlt.common.destination.typing import PreparedTableSchema
 from dlt.common.destination.reference import (
     DestinationClientDwhConfiguration,
     HasFollowupJobs,
@@ -66,6 +81,13 @@ from dlt.load.utils import (
     get_available_worker_slots,
 )
 
+# write dispositions that destination job clients know how to load
+LOADABLE_WRITE_DISPOSITIONS: FrozenSet[TWriteDisposition] = frozenset(
+    ("append", "replace", "merge")
+)
+# max time in seconds the loop waits on the pool before checking for signals
+SIGNAL_CHECK_INTERVAL: float = 0.1
+
 
 class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
     pool: Executor
@@ -88,32 +110,65 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.destination = destination
         self.staging_destination = staging_destination
         self.pool = NullExecutor()
+        # key under which this instance is registered in Runnable.RUNNING, passed to worker methods
+        self._runnable_id = id(self)
+        # worker method bound to this instance so only per job arguments are passed on submit
+        self._w_run_job: "partial[None]" = partial(Load.w_run_job, self._runnable_id)
+        # capabilities of the destination adjusted to resolved config, see `get_destination_capabilities`
+        self._destination_caps: DestinationCapabilitiesContext = None
+        # loader file formats of the staging destination, see `get_staging_file_formats`
+        self._staging_file_formats: FrozenSet[TLoaderFileFormat] = None
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._loaded_packages: List[LoadPackageInfo] = []
         self._job_metrics: Dict[str, LoadJobMetrics] = {}
+        # futures of jobs running on the pool, used to wake up the main loop when any job finishes
+        self._job_futures: Dict[str, "Future[None]"] = {}
+        # tables prepared by job clients for the package being loaded, see `get_prepared_load_table`
+        self._prepared_load_tables: Dict[Tuple[bool, str], PreparedTableSchema] = {}
         self._run_loop_sleep_duration: float = (
             1.0  # amount of time to sleep between querying completed jobs
         )
         super().__init__()
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
-        supported_file_formats = self.destination.capabilities().supported_loader_file_formats
         if self.staging_destination:
             supported_file_formats = (
                 self.staging_destination.capabilities().supported_loader_file_formats
             )
-        load_storage = LoadStorage(
+        else:
+            supported_file_formats = self.destination.capabilities().supported_loader_file_formats
+        # add internal job formats
+        internal_job_file_formats: List[TJobFileFormat] = []
+        if issubclass(self.destination.client_class, WithStagingDataset):
+            internal_job_file_formats.append("sql")
+        if self.staging_destination:
+            internal_job_file_formats.append("reference")
+        return LoadStorage(
             is_storage_owner,
             supported_file_formats,
             config=self.config._load_storage_config,
+            internal_job_file_formats=internal_job_file_formats,
         )
-        # add internal job formats
-        if issubclass(self.destination.client_class, WithStagingDataset):
-            load_storage.supported_job_file_formats += ["sql"]
-        if self.staging_destination:
-            load_storage.supported_job_file_formats += ["reference"]
 
-        return load_storage
+    def get_destination_capabilities(self) -> DestinationCapabilitiesContext:
+        """Returns destination capabilities adjusted to the resolved client config. Resolved once per Load instance"""
+        if self._destination_caps is None:
+            self._destination_caps = self.destination.capabilities(
+                self.destination.configuration(self.initial_client_config)
+            )
+        return self._destination_caps
+
+    def get_staging_file_formats(self) -> FrozenSet[TLoaderFileFormat]:
+        """Returns loader file formats supported by the staging destination, empty if there's no staging.
+        Evaluated once per Load instance, capabilities are re-created on each call to the destination.
+        """
+        if self._staging_file_formats is None:
+            self._staging_file_formats = (
+                frozenset(self.staging_destination.capabilities().supported_loader_file_formats)
+                if self.staging_destination
+                else frozenset()
+            )
+        return self._staging_file_formats
 
     def get_destination_client(self, schema: Schema) -> JobClientBase:
         return self.destination.client(schema, self.initial_client_config)
@@ -126,10 +181,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         # for now we know that reference jobs always go do the main destination
         if file_type == "reference":
             return False
-        return (
-            self.staging_destination is not None
-            and file_type in self.staging_destination.capabilities().supported_loader_file_formats
-        )
+        return file_type in self.get_staging_file_formats()
 
     @contextlib.contextmanager
     def maybe_with_staging_dataset(
@@ -181,8 +233,10 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 ) and job_client.should_load_data_to_staging_dataset(job_info.table_name)
 
             # prepare table to be loaded
-            load_table = active_job_client.prepare_load_table(job_info.table_name)
-            if load_table["write_disposition"] not in ["append", "replace", "merge"]:
+            load_table = self.get_prepared_load_table(
+                active_job_client, is_staging_destination_job, job_info.table_name
+            )
+            if load_table["write_disposition"] not in LOADABLE_WRITE_DISPOSITIONS:
                 raise LoadClientUnsupportedWriteDisposition(
                     job_info.table_name, load_table["write_disposition"], file_path
                 )
@@ -218,7 +272,13 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             # set job vars
             job.set_run_vars(load_id=load_id, schema=schema, load_table=load_table)
             # submit to pool
-            self.pool.submit(Load.w_run_job, *(id(self), job, is_staging_destination_job, use_staging_dataset, schema))  # type: ignore
+            self._job_futures[job.file_name()] = self.pool.submit(
+                self._w_run_job,
+                job,
+                is_staging_destination_job,
+                use_staging_dataset,
+                schema,
+            )
 
         # sanity check: otherwise a job in an actionable state is expected
         else:
@@ -226,6 +286,21 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
 
         return job
 
+    def get_prepared_load_table(
+        self, job_client: JobClientBase, is_staging_destination_job: bool, table_name: str
+    ) -> PreparedTableSchema:
+        """Prepares table `table_name` with `job_client` once per package. Each call receives a shallow copy
+        so jobs may set top level hints without affecting each other.
+        """
+        key = (is_staging_destination_job, table_name)
+        load_table = self._prepared_load_tables.get(key)
+        if load_table is None:
+            load_table = job_client.prepare_load_table(table_name)
+            if load_table is None:
+                return None
+            self._prepared_load_tables[key] = load_table
+        return load_table.copy()
+
     @staticmethod
     @workermethod
     def w_run_job(
@@ -253,9 +328,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         """
         will retrieve jobs from the new_jobs folder and start as many as there are slots available
         """
-        caps = self.destination.capabilities(
-            self.destination.configuration(self.initial_client_config)
-        )
+        caps = self.get_destination_capabilities()
 
         # early exit if no slots available
         available_slots = get_available_worker_slots(self.config, caps, running_jobs)
@@ -272,31 +345,20 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         )
 
         logger.info(f"Will load additional {len(load_files)}, creating jobs")
-        started_jobs: List[LoadJob] = []
-        for file in load_files:
-            job = self.submit_job(file, load_id, schema)
-            started_jobs.append(job)
-
-        return started_jobs
+        # submit_job always returns a job so no filtering is needed
+        return [self.submit_job(file, load_id, schema) for file in load_files]
 
     def resume_started_jobs(self, load_id: str, schema: Schema) -> List[LoadJob]:
         """
         will check jobs in the started folder and resume them
         """
-        jobs: List[LoadJob] = []
-
         # list all files that were started but not yet completed
         started_jobs = self.load_storage.normalized_packages.list_started_jobs(load_id)
 
         logger.info(f"Found {len(started_jobs)} that are already started and should be continued")
-        if len(started_jobs) == 0:
-            return jobs
-
-        for file_path in started_jobs:
-            job = self.submit_job(file_path, load_id, schema, restore=True)
-            jobs.append(job)
-
-        return jobs
+        return [
+            self.submit_job(file_path, load_id, schema, restore=True) for file_path in started_jobs
+        ]
 
     def get_new_jobs_info(self, load_id: str) -> List[ParsedLoadJobFileName]:
         return [
@@ -387,89 +449,161 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         # if an exception condition was met, return it to the main runner
         pending_exception: Optional[LoadClientJobException] = None
 
-        logger.info(f"Will complete {len(jobs)} for {load_id}")
-        for ii in range(len(jobs)):
-            job = jobs[ii]
-            logger.debug(f"Checking state for job {job.job_id()}")
-            state: TLoadJobState = job.state()
-            if state in ("ready", "running"):
-                # ask again
-                logger.debug(f"job {job.job_id()} still running")
-                remaining_jobs.append(job)
-            elif state == "failed":
-                # create followup jobs
-                self.create_followup_jobs(load_id, state, job, schema)
-
-                # preserve metrics
-                metrics = job.metrics()
-                if metrics:
-                    self._job_metrics[job.job_id()] = metrics
-
-                # try to get exception message from job
-                failed_message = job.exception()
-                self.load_storage.normalized_packages.fail_job(
-                    load_id, job.file_name(), failed_message
-                )
-                logger.error(
-                    f"Job for {job.job_id()} failed terminally in load {load_id} with message"
-                    f" {failed_message}"
-                )
-                # schedule exception on job failure
-                if self.config.raise_on_failed_jobs:
-                    pending_exception = LoadClientJobFailed(
-                        load_id,
-                        job.job_file_info().job_id(),
-                        failed_message,
-                    )
-                finalized_jobs.append(job)
-            elif state == "retry":
-                # try to get exception message from job
-                retry_message = job.exception()
-                # move back to new folder to try again
-                self.load_storage.normalized_packages.retry_job(load_id, job.file_name())
-                logger.warning(
-                    f"Job for {job.job_id()} retried in load {load_id} with message {retry_message}"
-                )
-                # possibly schedule exception on too many retries
-                if self.config.raise_on_max_retries:
-                    r_c = job.job_file_info().retry_count + 1
-                    if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
-                        pending_exception = LoadClientJobRetry(
-                            load_id,
-                            job.job_id(),
-                            r_c,
-                            self.config.raise_on_max_retries,
-                            retry_message=retry_message,
-                        )
-            elif state == "completed":
-                # create followup jobs
-                self.create_followup_jobs(load_id, state, job, schema)
-
-                # preserve metrics
-                # TODO: metrics should be persisted. this is different vs. all other steps because load step
-                # may be restarted in the middle of execution
-                # NOTE: we could use package state but cases with 100k jobs must be tested
-                metrics = job.metrics()
-                if metrics:
-                    self._job_metrics[job.job_id()] = metrics
-
-                # move to completed folder after followup jobs are created
-                # in case of exception when creating followup job, the loader will retry operation and try to complete again
-                self.load_storage.normalized_packages.complete_job(load_id, job.file_name())
-                logger.info(f"Job for {job.job_id()} completed in load {load_id}")
-                finalized_jobs.append(job)
-            else:
-                raise Exception("Incorrect job state")
+        # number of failed jobs among finalized, collector is updated once per call
+        failed_count = 0
 
-            if state in ["failed", "completed"]:
-                self.collector.update("Jobs")
+        logger.info(f"Will complete {len(jobs)} for {load_id}")
+        try:
+            for job in jobs:
+                # do not probe jobs that are still executed by the pool
+                file_name = job.file_name()
+                future = self._job_futures.get(file_name)
+                if future is not None and not future.done():
+                    remaining_jobs.append(job)
+                    continue
+                job_id = job.job_id()
+                logger.debug(f"Checking state for job {job_id}")
+                state: TLoadJobState = job.state()
+                if state in ("ready", "running"):
+                    # ask again
+                    logger.debug(f"job {job_id} still running")
+                    remaining_jobs.append(job)
+                    continue
                 if state == "failed":
-                    self.collector.update(
-                        "Jobs", 1, message="WARNING: Some of the jobs failed!", label="Failed"
-                    )
+                    new_pending_exception = self._complete_failed_job(load_id, job, schema)
+                elif state == "retry":
+                    new_pending_exception = self._complete_retried_job(load_id, job, schema)
+                elif state == "completed":
+                    new_pending_exception = self._complete_completed_job(load_id, job, schema)
+                else:
+                    raise Exception("Incorrect job state")
+                if new_pending_exception:
+                    pending_exception = new_pending_exception
+
+                # job reached its final state, its worker is done
+                self._job_futures.pop(file_name, None)
+
+                if state != "retry":
+                    finalized_jobs.append(job)
+                    if state == "failed":
+                        failed_count += 1
+        finally:
+            # update progress in batch instead of per job
+            if finalized_jobs:
+                self.collector.update("Jobs", len(finalized_jobs))
+            if failed_count:
+                self.collector.update(
+                    "Jobs",
+                    failed_count,
+                    message="WARNING: Some of the jobs failed!",
+                    label="Failed",
+                )
 
         return remaining_jobs, finalized_jobs, pending_exception
 
+    def _complete_failed_job(
+        self, load_id: str, job: LoadJob, schema: Schema
+    ) -> Optional[LoadClientJobException]:
+        # create followup jobs
+        self.create_followup_jobs(load_id, "failed", job, schema)
+
+        job_id = job.job_id()
+        # preserve metrics
+        metrics = job.metrics()
+        if metrics:
+            self._job_metrics[job_id] = metrics
+
+        # try to get exception message from job
+        failed_message = job.exception()
+        self.load_storage.normalized_packages.fail_job(load_id, job.file_name(), failed_message)
+        logger.error(
+            f"Job for {job_id} failed terminally in load {load_id} with message {failed_message}"
+        )
+        # schedule exception on job failure
+        if self.config.raise_on_failed_jobs:
+            return LoadClientJobFailed(
+                load_id,
+                job.job_file_info().job_id(),
+                failed_message,
+            )
+        return None
+
+    def _complete_retried_job(
+        self, load_id: str, job: LoadJob, schema: Schema
+    ) -> Optional[LoadClientJobException]:
+        job_id = job.job_id()
+        # try to get exception message from job
+        retry_message = job.exception()
+        # move back to new folder to try again
+        self.load_storage.normalized_packages.retry_job(load_id, job.file_name())
+        logger.warning(f"Job for {job_id} retried in load {load_id} with message {retry_message}")
+        # possibly schedule exception on too many retries
+        if self.config.raise_on_max_retries:
+            r_c = job.job_file_info().retry_count + 1
+            if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
+                return LoadClientJobRetry(
+                    load_id,
+                    job_id,
+                    r_c,
+                    self.config.raise_on_max_retries,
+                    retry_message=retry_message,
+                )
+        return None
+
+    def _complete_completed_job(
+        self, load_id: str, job: LoadJob, schema: Schema
+    ) -> Optional[LoadClientJobException]:
+        # create followup jobs
+        self.create_followup_jobs(load_id, "completed", job, schema)
+
+        job_id = job.job_id()
+        # preserve metrics
+        # TODO: metrics should be persisted. this is different vs. all other steps because load step
+        # may be restarted in the middle of execution
+        # NOTE: we could use package state but cases with 100k jobs must be tested
+        metrics = job.metrics()
+        if metrics:
+            self._job_metrics[job_id] = metrics
+
+        # move to completed folder after followup jobs are created
+        # in case of exception when creating followup job, the loader will retry operation and try to complete again
+        self.load_storage.normalized_packages.complete_job(load_id, job.file_name())
+        logger.info(f"Job for {job_id} completed in load {load_id}")
+        return None
+
+    def wait_for_running_jobs(self, running_jobs: Sequence[LoadJob]) -> None:
+        """Waits until any of the running jobs completes or fails on the pool or the loop sleep duration passes.
+
+        Returns immediately if a job already completed or failed. Retried jobs and jobs that are not
+        backed by a pending future are polled in regular intervals. Raises on signal.
+        """
+        pending: Dict["Future[None]", LoadJob] = {}
+        for job in running_jobs:
+            future = self._job_futures.get(job.file_name())
+            if future is not None and not future.done():
+                pending[future] = job
+            elif job.state() in ("completed", "failed"):
+                signals.raise_if_signalled()
+                return
+        deadline = time.monotonic() + self._run_loop_sleep_duration
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                signals.raise_if_signalled()
+                return
+            # pool wait does not watch the exit event so wait in slices to notice signals
+            done, _ = wait(
+                pending,
+                timeout=min(remaining, SIGNAL_CHECK_INTERVAL),
+                return_when=FIRST_COMPLETED,
+            )
+            signals.raise_if_signalled()
+            for future in done:
+                if pending.pop(future).state() in ("completed", "failed"):
+                    return
+        # nothing left to wait for on the pool, poll retried and remaining jobs in regular intervals
+        sleep(max(0.0, deadline - time.monotonic()))
+
     def complete_package(self, load_id: str, schema: Schema, aborted: bool = False) -> None:
         # do not commit load id for aborted packages
         if not aborted:
@@ -519,10 +653,13 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         truncated_tables = current_load_package()["state"].get("truncated_tables", [])
 
         self.init_jobs_counter(load_id)
+        self._job_futures.clear()
+        self._prepared_load_tables.clear()
 
         # initialize analytical storage ie. create dataset required by passed schema
-        with self.get_destination_client(schema) as job_client:
-            if (expected_update := self.load_storage.begin_schema_update(load_id)) is not None:
+        # the destination client is opened only if there's a schema update to apply
+        if (expected_update := self.load_storage.begin_schema_update(load_id)) is not None:
+            with self.get_destination_client(schema) as job_client:
                 # init job client
                 applied_update = init_client(
                     job_client,
@@ -560,8 +697,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                         )
                 self.load_storage.commit_schema_update(load_id, applied_update)
 
-            # collect all unfinished jobs
-            running_jobs: List[LoadJob] = self.resume_started_jobs(load_id, schema)
+        # collect all unfinished jobs
+        running_jobs: List[LoadJob] = self.resume_started_jobs(load_id, schema)
 
         # loop until all jobs are processed
         pending_exception: Optional[LoadClientJobException] = None
@@ -596,8 +733,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                     if pending_exception:
                         raise pending_exception
                     break
-                # this will raise on signal
-                sleep(self._run_loop_sleep_duration)
+                # wake up as soon as any job finishes, this will raise on signal
+                self.wait_for_running_jobs(running_jobs)
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
@@ -613,8 +750,9 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         logger.info("Running file loading")
         # get list of loads and order by name ASC to execute schema updates
         loads = self.load_storage.list_normalized_packages()
-        logger.info(f"Found {len(loads)} load packages")
-        if len(loads) == 0:
+        n_loads = len(loads)
+        logger.info(f"Found {n_loads} load packages")
+        if n_loads == 0:
             return TRunMetrics(True, 0)
 
         # load the schema from the package
@@ -637,7 +775,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                     self._step_info_start_load_id(load_id)
                 self.load_single_package(load_id, schema)
 
-        return TRunMetrics(False, len(self.load_storage.list_normalized_packages()))
+        # the package was completed (otherwise an exception is raised) so we do not list packages again
+        return TRunMetrics(False, n_loads - 1)
 
     def _maybe_truncate_staging_dataset(self, schema: Schema, job_client: JobClientBase) -> None:
         """
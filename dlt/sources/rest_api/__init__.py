@@ -1,10 +1,28 @@
 """Generic API Source"""
-from copy import deepcopy
-from typing import Type, Any, Dict, List, Optional, Generator, Callable, cast, Union
+
+import inspect
+from copy import copy
+from typing import (
+    Type,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Generator,
+    Sequence,
+    Callable,
+    Set,
+    Tuple,
+    cast,
+    Union,
+)
 import graphlib  # type: ignore[import,unused-ignore]
 from requests.auth import AuthBase
 
 import dlt
+from dlt.common.utils import digest128, identity
+from dlt.common.exceptions import DictValidationException
 from dlt.common.validation import validate_dict
 from dlt.common import jsonpath
 from dlt.common.schema.schema import Schema
@@ -48,12 +66,15 @@ from .utils import check_connection, exclude_keys  # noqa: F401
 
 PARAM_TYPES: List[ParamBindType] = ["incremental", "resolve"]
 MIN_SECRET_MASKING_LENGTH = 3
-SENSITIVE_KEYS: List[str] = [
-    "token",
-    "api_key",
-    "username",
-    "password",
-]
+SECRET_MASK = "*****"
+SENSITIVE_KEYS: FrozenSet[str] = frozenset(("token", "api_key", "username", "password"))
+# endpoint resource keys that are not passed to `dlt.resource`
+NON_RESOURCE_ARGS_KEYS: FrozenSet[str] = frozenset(
+    ("endpoint", "include_from_parent", "processing_steps")
+)
+MAX_VALIDATED_CONFIGS = 128
+# fingerprints of configs that passed validation
+_validated_configs: Set[str] = set()
 
 
 def rest_api_source(
@@ -216,6 +237,15 @@ def create_resources(
 ) -> Dict[str, DltResource]:
     resources = {}
 
+    # client holds no per resource state: the default paginator is copied on each paginate call
+    client = RESTClient(
+        base_url=client_config["base_url"],
+        headers=client_config.get("headers"),
+        auth=create_auth(client_config.get("auth")),
+        paginator=create_paginator(client_config.get("paginator")),
+        session=client_config.get("session"),
+    )
+
     for resource_name in dependency_graph.static_order():
         resource_name = cast(str, resource_name)
         endpoint_resource = endpoint_resource_map[resource_name]
@@ -224,10 +254,16 @@ def create_resources(
             continue
 
         endpoint_config = cast(Endpoint, endpoint_resource["endpoint"])
+        method = endpoint_config.get("method", "get")
+        path = endpoint_config.get("path")
+        data_selector = endpoint_config.get("data_selector")
+        if data_selector:
+            # compile once, otherwise the selector is parsed again for every page
+            data_selector = jsonpath.compile_path(data_selector)
         request_params = endpoint_config.get("params", {})
         request_json = endpoint_config.get("json", None)
         paginator = create_paginator(endpoint_config.get("paginator"))
-        processing_steps = endpoint_resource.pop("processing_steps", [])
+        processing_steps = endpoint_resource.get("processing_steps") or ()
 
         resolved_param: ResolvedParam = resolved_param_map[resource_name]
 
@@ -244,28 +280,11 @@ def create_resources(
             incremental_cursor_transform,
         ) = setup_incremental_object(request_params, endpoint_config.get("incremental"))
 
-        client = RESTClient(
-            base_url=client_config["base_url"],
-            headers=client_config.get("headers"),
-            auth=create_auth(client_config.get("auth")),
-            paginator=create_paginator(client_config.get("paginator")),
-            session=client_config.get("session"),
-        )
-
         hooks = create_response_hooks(endpoint_config.get("response_actions"))
 
-        resource_kwargs = exclude_keys(endpoint_resource, {"endpoint", "include_from_parent"})
-
-        def process(
-            resource: DltResource,
-            processing_steps: List[ProcessingSteps],
-        ) -> Any:
-            for step in processing_steps:
-                if "filter" in step:
-                    resource.add_filter(step["filter"])
-                if "map" in step:
-                    resource.add_map(step["map"])
-            return resource
+        resource_kwargs: Dict[str, Any] = {
+            k: v for k, v in endpoint_resource.items() if k not in NON_RESOURCE_ARGS_KEYS
+        }
 
         if resolved_param is None:
 
@@ -306,21 +325,23 @@ def create_resources(
                 paginate_resource,
                 **resource_kwargs,  # TODO: implement typing.Unpack
             )(
-                method=endpoint_config.get("method", "get"),
-                path=endpoint_config.get("path"),
+                method=method,
+                path=path,
                 params=request_params,
                 json=request_json,
                 paginator=paginator,
-                data_selector=endpoint_config.get("data_selector"),
+                data_selector=data_selector,
                 hooks=hooks,
             )
 
-            resources[resource_name] = process(resources[resource_name], processing_steps)
+            resources[resource_name] = _process_resource(resources[resource_name], processing_steps)
 
         else:
             predecessor = resources[resolved_param.resolve_config["resource"]]
 
-            base_params = exclude_keys(request_params, {resolved_param.param_name})
+            base_params = {
+                k: v for k, v in request_params.items() if k != resolved_param.param_name
+            }
 
             def paginate_dependent_resource(
                 items: List[Dict[str, Any]],
@@ -352,53 +373,81 @@ def create_resources(
                         path, item, resolved_param, include_from_parent
                     )
 
-                    for child_page in client.paginate(
+                    child_pages = client.paginate(
                         method=method,
                         path=formatted_path,
                         params=params,
                         paginator=paginator,
                         data_selector=data_selector,
                         hooks=hooks,
-                    ):
-                        if parent_record:
+                    )
+                    if parent_record:
+                        for child_page in child_pages:
                             for child_record in child_page:
                                 child_record.update(parent_record)
-                        yield child_page
+                            yield child_page
+                    else:
+                        # nothing to include from parent, pass pages through
+                        yield from child_pages
 
             resources[resource_name] = dlt.resource(  # type: ignore[call-overload]
                 paginate_dependent_resource,
                 data_from=predecessor,
                 **resource_kwargs,  # TODO: implement typing.Unpack
             )(
-                method=endpoint_config.get("method", "get"),
-                path=endpoint_config.get("path"),
+                method=method,
+                path=path,
                 params=base_params,
                 paginator=paginator,
-                data_selector=endpoint_config.get("data_selector"),
+                data_selector=data_selector,
                 hooks=hooks,
             )
 
-            resources[resource_name] = process(resources[resource_name], processing_steps)
+            resources[resource_name] = _process_resource(resources[resource_name], processing_steps)
 
     return resources
 
 
 def _validate_config(config: RESTAPIConfig) -> None:
-    c = deepcopy(config)
-    client_config = c.get("client")
+    # repr contains class names and field values of the objects in config so it does not mix up
+    # objects with dicts or strings that serialize the same way
+    fingerprint = digest128(repr(config))
+    if fingerprint in _validated_configs:
+        return
+
+    try:
+        validate_dict(RESTAPIConfig, config, path=".")
+        is_valid = True
+    except DictValidationException:
+        is_valid = False
+    if not is_valid:
+        # validate again with masked secrets so they are not printed in the error message. this
+        # happens outside of the except block so the original exception is not chained
+        validate_dict(RESTAPIConfig, _mask_config_secrets(config), path=".")
+
+    if len(_validated_configs) >= MAX_VALIDATED_CONFIGS:
+        _validated_configs.clear()
+    _validated_configs.add(fingerprint)
+
+
+def _mask_config_secrets(config: RESTAPIConfig) -> RESTAPIConfig:
+    client_config = config.get("client")
     if client_config:
         auth = client_config.get("auth")
         if auth:
-            auth = _mask_secrets(auth)
-
-    validate_dict(RESTAPIConfig, c, path=".")
+            # auth is the only part that gets modified, copy just the path leading to it
+            return cast(
+                RESTAPIConfig,
+                {**config, "client": {**client_config, "auth": _mask_secrets(copy(auth))}},
+            )
+    return config
 
 
 def _mask_secrets(auth_config: AuthConfig) -> AuthConfig:
     if isinstance(auth_config, AuthBase) and not isinstance(auth_config, AuthConfigBase):
         return auth_config
 
-    has_sensitive_key = any(key in auth_config for key in SENSITIVE_KEYS)
+    has_sensitive_key = not SENSITIVE_KEYS.isdisjoint(auth_config)
     if isinstance(auth_config, (APIKeyAuth, BearerTokenAuth, HttpBasicAuth)) or has_sensitive_key:
         return _mask_secrets_dict(auth_config)
     # Here, we assume that OAuth2 and other custom classes that don't implement __get__()
@@ -408,11 +457,9 @@ def _mask_secrets(auth_config: AuthConfig) -> AuthConfig:
 
 
 def _mask_secrets_dict(auth_config: AuthConfig) -> AuthConfig:
-    for sensitive_key in SENSITIVE_KEYS:
-        try:
-            auth_config[sensitive_key] = _mask_secret(auth_config[sensitive_key])  # type: ignore[literal-required, index]
-        except KeyError:
-            continue
+    # iterate only the sensitive keys present in auth config
+    for sensitive_key in SENSITIVE_KEYS.intersection(auth_config):
+        auth_config[sensitive_key] = _mask_secret(auth_config[sensitive_key])  # type: ignore[literal-required, index]
     return auth_config
 
 
@@ -420,8 +467,72 @@ def _mask_secret(secret: Optional[str]) -> str:
     if secret is None:
         return "None"
     if len(secret) < MIN_SECRET_MASKING_LENGTH:
-        return "*****"
-    return f"{secret[0]}*****{secret[-1]}"
+        return SECRET_MASK
+    return secret[0] + SECRET_MASK + secret[-1]
+
+
+def _process_resource(
+    resource: DltResource,
+    processing_steps: Sequence[ProcessingSteps],
+) -> DltResource:
+    for step_type, step_f in _fuse_processing_steps(processing_steps):
+        if step_type == "filter":
+            resource.add_filter(step_f)
+        else:
+            resource.add_map(step_f)
+    return resource
+
+
+def _fuse_processing_steps(
+    processing_steps: Sequence[ProcessingSteps],
+) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """Fuses consecutive filters and consecutive maps into single functions so each data item
+    passes fewer pipe steps. The order of filters and maps is preserved. Functions that also
+    take `meta` are installed unchanged.
+    """
+    groups: List[Tuple[str, List[Callable[[Any], Any]]]] = []
+    can_extend = False
+    for step in processing_steps:
+        # within a step filter is applied before map
+        for step_type in ("filter", "map"):
+            if step_type in step:
+                step_f = step[step_type]  # type: ignore[literal-required]
+                # same check as ItemTransform uses to decide if meta is passed
+                takes_item_only = len(inspect.signature(step_f).parameters) == 1
+                if takes_item_only and can_extend and groups[-1][0] == step_type:
+                    groups[-1][1].append(step_f)
+                else:
+                    groups.append((step_type, [step_f]))
+                can_extend = takes_item_only
+
+    fused: List[Tuple[str, Callable[[Any], Any]]] = []
+    for step_type, functions in groups:
+        if len(functions) == 1:
+            fused.append((step_type, functions[0]))
+        elif step_type == "filter":
+            fused.append((step_type, _all_filters(tuple(functions))))
+        else:
+            fused.append((step_type, _chain_maps(tuple(functions))))
+    return fused
+
+
+def _all_filters(filters: Tuple[Callable[[Any], bool], ...]) -> Callable[[Any], bool]:
+    def _filter(item: Any) -> bool:
+        for filter_f in filters:
+            if not filter_f(item):
+                return False
+        return True
+
+    return _filter
+
+
+def _chain_maps(maps: Tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    def _map(item: Any) -> Any:
+        for map_f in maps:
+            item = map_f(item)
+        return item
+
+    return _map
 
 
 def _set_incremental_params(
@@ -430,11 +541,8 @@ def _set_incremental_params(
     incremental_param: IncrementalParam,
     transform: Optional[Callable[..., Any]],
 ) -> Dict[str, Any]:
-    def identity_func(x: Any) -> Any:
-        return x
-
     if transform is None:
-        transform = identity_func
+        transform = identity
     params[incremental_param.start] = transform(incremental_object.last_value)
     if incremental_param.end:
         params[incremental_param.end] = transform(incremental_object.end_value)
@@ -444,7 +552,7 @@ def _set_incremental_params(
 def _validate_param_type(
     request_params: Dict[str, Union[ResolveParamConfig, IncrementalParamConfig, Any]]
 ) -> None:
-    for _, value in request_params.items():
+    for value in request_params.values():
         if isinstance(value, dict) and value.get("type") not in PARAM_TYPES:
             raise ValueError(
                 f"Invalid param type: {value.get('type')}. Available options: {PARAM_TYPES}"
@@ -454,12 +562,13 @@ def _validate_param_type(
 # XXX: This is a workaround pass test_dlt_init.py
 # since the source uses dlt.source as a function
 def _register_source(source_func: Callable[..., DltSource]) -> None:
-    import inspect
+    import sys
     from dlt.common.configuration import get_fun_spec
     from dlt.common.source import _SOURCES, SourceInfo
 
     spec = get_fun_spec(source_func)
-    func_module = inspect.getmodule(source_func)
+    # the source is defined in this module which is being imported
+    func_module = sys.modules[source_func.__module__]
     _SOURCES[source_func.__name__] = SourceInfo(
         SPEC=spec,
         f=source_func,
@@ -1,5 +1,6 @@
 import warnings
 from copy import copy
+from functools import lru_cache
 from typing import (
     Type,
     Any,
@@ -205,7 +206,10 @@ def setup_incremental_object(
             f" {incremental_params}"
         )
     convert: Optional[Callable[..., Any]]
-    for param_name, param_config in request_params.items():
+    if incremental_params:
+        # the single incremental param found above, params are not scanned again
+        param_name = incremental_params[0]
+        param_config = request_params[param_name]
         if isinstance(param_config, dlt.sources.incremental):
             if param_config.end_value is not None:
                 raise ValueError(
@@ -215,7 +219,7 @@ def setup_incremental_object(
                     " https://dlthub.com/docs/dlt-ecosystem/verified-sources/rest_api#incremental-loading/"
                 )
             return param_config, IncrementalParam(start=param_name, end=None), None
-        if isinstance(param_config, dict) and param_config.get("type") == "incremental":
+        else:
             if param_config.get("end_value") or param_config.get("end_param"):
                 raise ValueError(
                     "Only start_param and initial_value are allowed in the configuration of param:"
@@ -571,6 +575,25 @@ def create_response_hooks(
     return None
 
 
+@lru_cache(maxsize=128)
+def _parse_path_template(path: str, param_name: str) -> Optional[Tuple[str, ...]]:
+    """Splits `path` into literal segments around `param_name` placeholders. Returns None
+    if the template has other fields, conversions or format specs and must be formatted.
+    """
+    segments = [""]
+    try:
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(path):
+            segments[-1] += literal
+            if field_name is None:
+                continue
+            if field_name != param_name or format_spec or conversion:
+                return None
+            segments.append("")
+    except ValueError:
+        return None
+    return tuple(segments)
+
+
 def process_parent_data_item(
     path: str,
     item: Dict[str, Any],
@@ -588,7 +611,11 @@ def process_parent_data_item(
             f" resource {parent_resource_name} in order to bind it to path param"
             f" {resolved_param.param_name}. Available parent fields are {', '.join(item.keys())}"
         )
-    bound_path = path.format(**{resolved_param.param_name: field_values[0]})
+    path_segments = _parse_path_template(path, resolved_param.param_name)
+    if path_segments is None:
+        bound_path = path.format(**{resolved_param.param_name: field_values[0]})
+    else:
+        bound_path = str(field_values[0]).join(path_segments)
 
     parent_record: Dict[str, Any] = {}
     if include_from_parent:
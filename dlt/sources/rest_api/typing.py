@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing_extensions import TypedDict
 
 from typing import (
@@ -20,7 +20,7 @@ from dlt.extract.items import TTableHintTemplate
 from dlt.extract.hints import TResourceHintsBase
 from dlt.sources.helpers.rest_client.auth import AuthConfigBase, TApiKeyLocation
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from dlt.common import jsonpath
 from dlt.common.typing import TSortOrder
@@ -222,12 +222,15 @@ class IncrementalParamConfig(ParamBindConfig, IncrementalRESTArgs):
 
 @dataclass
 class ResolvedParam:
+    # declared explicitly, dataclass(slots=True) requires python 3.10
+    __slots__ = ("param_name", "resolve_config", "field_path")
+
     param_name: str
     resolve_config: ResolveParamConfig
-    field_path: jsonpath.TJsonPath = field(init=False)
 
     def __post_init__(self) -> None:
-        self.field_path = jsonpath.compile_path(self.resolve_config["field"])
+        # derived from resolve_config, kept out of the dataclass fields so the slot has no default
+        self.field_path: jsonpath.TJsonPath = jsonpath.compile_path(self.resolve_config["field"])
 
 
 class ResponseActionDict(TypedDict, total=False):
@@ -1,13 +1,18 @@
 import os
 import pyodbc
 import pytest
+from pytest_mock import MockerFixture
 
 from dlt.common.configuration import resolve_configuration, ConfigFieldMissingException
 from dlt.common.exceptions import SystemConfigurationException
 from dlt.common.schema import Schema
 
 from dlt.destinations import mssql
-from dlt.destinations.impl.mssql.configuration import MsSqlCredentials, MsSqlClientConfiguration
+from dlt.destinations.impl.mssql.configuration import (
+    MsSqlCredentials,
+    MsSqlClientConfiguration,
+    _available_drivers,
+)
 
 # mark all tests as essential, do not remove
 pytestmark = pytest.mark.essential
@@ -156,6 +161,27 @@ def test_to_odbc_dsn_arbitrary_keys_specified() -> None:
     }
 
 
+def test_to_odbc_dsn_plain_dict_query() -> None:
+    # Case: query set from fields is a plain dict, overrides are still case insensitive.
+    creds = MsSqlCredentials()
+    creds.host = "sql.example.com"
+    creds.database = "test_db"
+    creds.username = "test_user"
+    creds.password = "test_pwd"  # type: ignore[assignment]
+    creds.driver = "ODBC Driver 18 for SQL Server"
+    creds.query = {"server": "other,1444", "Encrypt": "yes"}
+    dsn = creds.to_odbc_dsn()
+    result = {k: v for k, v in (param.split("=") for param in dsn.split(";"))}
+    assert result == {
+        "DRIVER": "ODBC Driver 18 for SQL Server",
+        "SERVER": "other,1444",
+        "DATABASE": "test_db",
+        "UID": "test_user",
+        "PWD": "test_pwd",
+        "ENCRYPT": "yes",
+    }
+
+
 available_drivers = [d for d in pyodbc.drivers() if d in MsSqlCredentials.SUPPORTED_DRIVERS]
 
 
@@ -177,3 +203,19 @@ def test_to_odbc_dsn_driver_not_specified() -> None:
         }
         for d in MsSqlCredentials.SUPPORTED_DRIVERS
     ]
+
+
+def test_available_drivers_cached(mocker: MockerFixture) -> None:
+    _available_drivers.cache_clear()
+    mocker.patch("pyodbc.drivers", return_value=["SQLite3", "ODBC Driver 17 for SQL Server"])
+    try:
+        for _ in range(3):
+            creds = MsSqlCredentials()
+            creds.host = "sql.example.com"
+            creds.on_partial()
+            assert creds.driver == "ODBC Driver 17 for SQL Server"
+        # driver manager enumerated only once
+        assert _available_drivers.cache_info().misses == 1
+    finally:
+        _available_drivers.cache_clear()
+
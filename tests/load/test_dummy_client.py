@@ -1,12 +1,19 @@
 import os
-from concurrent.futures import ThreadPoolExecutor
+import signal
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from time import sleep, time
 from unittest import mock
 import pytest
 from unittest.mock import patch
 from typing import List, Tuple
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
+from dlt.common.exceptions import (
+    SignalReceivedException,
+    TerminalException,
+    TerminalValueError,
+)
+from dlt.common.runtime import signals
 from dlt.common.storages import FileStorage, PackageStorage, ParsedLoadJobFileName
 from dlt.common.storages.configuration import FilesystemConfiguration
 from dlt.common.storages.load_package import TPackageJobState
@@ -129,15 +136,117 @@ def test_big_loadpackages() -> None:
         load.run(pool)
     duration = float(time() - start_time)
 
-    # sanity check
-    assert duration > 3
-    # we want 1000 empty processed jobs to need less than 15 seconds total (locally it runs in 5)
+    # we want 1000 empty processed jobs to need less than 15 seconds total (locally it runs in 3)
     assert duration < 15
 
     # we should have 1000 jobs processed
     assert len(dummy_impl.JOBS) == 1000
 
 
+def test_loop_wakes_up_on_job_completion() -> None:
+    load = setup_loader()
+    # loop must not wait for the sleep duration when jobs finish on the pool
+    load._run_loop_sleep_duration = 30.0
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    start_time = time()
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        load.run(pool)
+    assert time() - start_time < 15
+    assert not load._job_futures
+    assert not load.load_storage.normalized_packages.storage.has_folder(
+        load.load_storage.get_normalized_package_path(load_id)
+    )
+
+
+def test_wait_for_running_jobs_raises_on_signal() -> None:
+    load = setup_loader()
+    load._run_loop_sleep_duration = 30.0
+    pooled_job = mock.Mock(
+        **{"file_name.return_value": "pooled.jsonl", "state.return_value": "running"}
+    )
+    load._job_futures["pooled.jsonl"] = Future()
+    timer = threading.Timer(0.5, signals.signal_receiver, (signal.SIGINT, None))
+    timer.start()
+    start_time = time()
+    try:
+        with pytest.raises(SignalReceivedException):
+            load.wait_for_running_jobs([pooled_job])
+        assert time() - start_time < 15
+    finally:
+        timer.cancel()
+        signals.exit_event.clear()
+        signals._received_signal = 0
+
+
+def test_wait_for_running_jobs_wakes_up_with_polled_jobs() -> None:
+    load = setup_loader()
+    load._run_loop_sleep_duration = 30.0
+    # polled job must not prevent waiting on the pending future of the other job
+    polled_job = mock.Mock(
+        **{"file_name.return_value": "polled.jsonl", "state.return_value": "ready"}
+    )
+    pooled_job = mock.Mock(
+        **{"file_name.return_value": "pooled.jsonl", "state.return_value": "completed"}
+    )
+    future: Future[None] = Future()
+    load._job_futures["pooled.jsonl"] = future
+    timer = threading.Timer(0.5, future.set_result, (None,))
+    timer.start()
+    start_time = time()
+    try:
+        load.wait_for_running_jobs([polled_job, pooled_job])
+        assert time() - start_time < 15
+    finally:
+        timer.cancel()
+
+
+def test_destination_capabilities_resolved_once() -> None:
+    load = setup_loader()
+    caps = load.get_destination_capabilities()
+    assert caps.supported_loader_file_formats
+    with patch.object(load.destination, "configuration") as configuration:
+        assert load.get_destination_capabilities() is caps
+        assert configuration.call_count == 0
+
+
+def test_staging_file_formats_evaluated_once() -> None:
+    load = setup_loader()
+    assert load.get_staging_file_formats() == frozenset()
+    assert (
+        load.is_staging_destination_job("event_user.839c6e6b514e427687586ccc65bf133f.0.jsonl")
+        is False
+    )
+
+    load = setup_loader(filesystem_staging=True)
+    file_formats = load.get_staging_file_formats()
+    assert "jsonl" in file_formats
+    with patch.object(load.staging_destination, "capabilities") as capabilities:
+        assert load.is_staging_destination_job(
+            "event_user.839c6e6b514e427687586ccc65bf133f.0.jsonl"
+        )
+        assert not load.is_staging_destination_job(
+            "event_user.839c6e6b514e427687586ccc65bf133f.0.reference"
+        )
+        assert load.get_staging_file_formats() is file_formats
+        assert capabilities.call_count == 0
+
+
+def test_client_not_opened_without_schema_update() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, [])
+    # schema update already applied in previous run
+    load.load_storage.commit_schema_update(load_id, {})
+    with patch.object(
+        load, "get_destination_client", wraps=load.get_destination_client
+    ) as get_client:
+        load.run(ThreadPoolExecutor())
+    # client is opened only to complete the package
+    assert get_client.call_count == 1
+    assert not load.load_storage.normalized_packages.storage.has_folder(
+        load.load_storage.get_normalized_package_path(load_id)
+    )
+
+
 def test_get_new_jobs_info() -> None:
     load = setup_loader()
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
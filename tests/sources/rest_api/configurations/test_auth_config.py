@@ -14,6 +14,7 @@ from dlt.common.typing import TSecretStrValue
 from dlt.common.utils import custom_environ
 from dlt.sources.rest_api import (
     _mask_secrets,
+    _validate_config,
     rest_api_source,
 )
 from dlt.sources.rest_api.config_setup import (
@@ -309,3 +310,18 @@ def test_validation_masks_auth_secrets() -> None:
         re.search("sensitive-secret", str(e.value)) is None
     ), "unexpectedly printed 'sensitive-secret'"
     assert e.match(re.escape("'{'type': 'bearer', 'location': 'header', 'token': 's*****t'}'"))
+    # exception with unmasked secrets is not chained
+    assert e.value.__context__ is None
+
+
+def test_validation_does_not_modify_auth() -> None:
+    auth_dict = {"type": "bearer", "token": "sensitive-secret"}
+    auth_obj = BearerTokenAuth(cast(TSecretStrValue, "sensitive-secret"))
+    for auth in (auth_dict, auth_obj):
+        config: RESTAPIConfig = {
+            "client": {"base_url": "https://api.example.com", "auth": auth},  # type: ignore[typeddict-item]
+            "resources": ["posts"],
+        }
+        _validate_config(config)
+        assert config["client"]["auth"] is auth
+        assert auth["token"] == "sensitive-secret"
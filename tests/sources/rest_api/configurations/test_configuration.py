@@ -14,6 +14,7 @@ from dlt.sources.helpers.rest_client.paginators import (
     SinglePagePaginator,
 )
 from dlt.sources.rest_api import (
+    _validate_config,
     rest_api_resources,
     rest_api_source,
 )
@@ -52,6 +53,55 @@ def test_valid_configurations(valid_config):
     rest_api_source(valid_config)
 
 
+def test_valid_configuration_validated_once() -> None:
+    config: RESTAPIConfig = {
+        "client": {"base_url": "https://api.example.com", "paginator": SinglePagePaginator()},
+        "resources": ["posts", {"name": "users", "endpoint": {"params": {"limit": 100}}}],
+    }
+    with patch("dlt.sources.rest_api.validate_dict") as validate_dict:
+        _validate_config(config)
+        # an equal config built again is not validated again
+        equal_config = cast(RESTAPIConfig, update_dict_nested({}, dict(config)))
+        _validate_config(equal_config)
+        assert validate_dict.call_count == 1
+        # different paginator instance is validated
+        other_config: RESTAPIConfig = {
+            **config,
+            "client": {**config["client"], "paginator": SinglePagePaginator()},
+        }
+        _validate_config(other_config)
+        assert validate_dict.call_count == 2
+
+
+def test_invalid_configuration_always_validated() -> None:
+    invalid_config = {"client": {"base_url": "https://api.example.com"}, "resources": [1]}
+    for _ in range(2):
+        with pytest.raises(dlt.common.exceptions.DictValidationException):
+            rest_api_source(invalid_config)  # type: ignore[arg-type]
+
+
+def test_client_shared_by_resources() -> None:
+    config: RESTAPIConfig = {
+        "client": {"base_url": "https://api.example.com"},
+        "resources": [
+            "posts",
+            {
+                "name": "post_comments",
+                "endpoint": {
+                    "path": "posts/{post_id}/comments",
+                    "params": {
+                        "post_id": {"type": "resolve", "resource": "posts", "field": "id"},
+                    },
+                },
+            },
+        ],
+    }
+    with patch("dlt.sources.rest_api.RESTClient") as client_cls:
+        resources = rest_api_resources(config)
+    assert len(resources) == 2
+    assert client_cls.call_count == 1
+
+
 @pytest.mark.parametrize("config", VALID_CONFIGS)
 def test_configurations_dict_is_not_modified_in_place(config):
     # deep clone dicts but do not touch instances of classes so ids still compare
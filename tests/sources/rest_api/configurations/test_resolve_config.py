@@ -138,6 +138,24 @@ def test_process_parent_data_item() -> None:
     assert "in order to include it in child records under _issues_node" in str(val_ex.value)
 
 
+def test_process_parent_data_item_path_template() -> None:
+    resolve_param = ResolvedParam(
+        "id", {"field": "obj_id", "resource": "issues", "type": "resolve"}
+    )
+    item = {"obj_id": 12345}
+    # placeholder repeated and escaped braces are bound without str.format
+    bound_path, _ = process_parent_data_item("issues/{id}/{{raw}}/{id}", item, resolve_param, None)
+    assert bound_path == "issues/12345/{raw}/12345"
+    # format specs and conversions fall back to str.format
+    bound_path, _ = process_parent_data_item("issues/{id:08d}", item, resolve_param, None)
+    assert bound_path == "issues/00012345"
+    bound_path, _ = process_parent_data_item("issues/{id!r}", {"obj_id": "a"}, resolve_param, None)
+    assert bound_path == "issues/'a'"
+    # other placeholders still raise
+    with pytest.raises(KeyError):
+        process_parent_data_item("{org}/issues/{id}", item, resolve_param, None)
+
+
 def test_two_resources_can_depend_on_one_parent_resource() -> None:
     user_id = {
         "user_id": {
@@ -264,6 +264,31 @@ def test_posts_under_results_key(mock_api_server):
     ]
 
 
+def test_data_selector_compiled_once(mock_api_server):
+    from dlt.common import jsonpath
+
+    with mock.patch.object(jsonpath, "_parse", wraps=jsonpath._parse) as parse:
+        mock_source = rest_api_source(
+            {
+                "client": {"base_url": "https://api.example.com"},
+                "resources": [
+                    {
+                        "name": "posts",
+                        "endpoint": {
+                            "path": "posts",
+                            "data_selector": "data",
+                            "paginator": {"type": "json_link", "next_url_path": "next_page"},
+                        },
+                    },
+                ],
+            }
+        )
+        res = list(mock_source.with_resources("posts").add_limit(3))
+
+    assert len(res) == 3 * DEFAULT_PAGE_SIZE
+    assert [c for c in parse.call_args_list if c.args == ("data",)] == [mock.call("data")]
+
+
 def test_posts_without_key(mock_api_server):
     mock_source = rest_api_source(
         {
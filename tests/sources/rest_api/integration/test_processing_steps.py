@@ -165,6 +165,89 @@ def test_rest_api_source_filter_and_map(mock_api_server) -> None:
     assert data[0]["title"] == "Post 10"
 
 
+def test_rest_api_source_consecutive_steps_fused(mock_api_server) -> None:
+    def id_plus_1(row):
+        row["id"] = row["id"] + 1
+        return row
+
+    def id_by_10(row):
+        row["id"] = row["id"] * 10
+        return row
+
+    config: RESTAPIConfig = {
+        "client": {
+            "base_url": "https://api.example.com",
+        },
+        "resources": [
+            {
+                "name": "posts",
+                "endpoint": "posts",
+                "processing_steps": [
+                    {"filter": lambda x: x["id"] > 1},  # type: ignore[typeddict-item]
+                    {"filter": lambda x: x["id"] < 4},  # type: ignore[typeddict-item]
+                    {"map": id_plus_1},  # type: ignore[typeddict-item]
+                    {"map": id_by_10},  # type: ignore[typeddict-item]
+                    {"filter": lambda x: x["id"] == 40},  # type: ignore[typeddict-item]
+                ],
+            },
+            {
+                "name": "posts_no_steps",
+                "endpoint": "posts",
+            },
+        ],
+    }
+    mock_source = rest_api_source(config)
+    # consecutive filters and maps are installed as single steps
+    no_steps_len = len(mock_source.resources["posts_no_steps"]._pipe)
+    assert len(mock_source.resources["posts"]._pipe) == no_steps_len + 3
+
+    data = list(mock_source.with_resources("posts"))
+    assert len(data) == 1
+    assert data[0]["id"] == 40
+    assert data[0]["title"] == "Post 3"
+
+
+def test_rest_api_source_steps_with_meta_not_fused(mock_api_server) -> None:
+    def id_plus_1(row):
+        row["id"] = row["id"] + 1
+        return row
+
+    def meta_id_by_10(row, meta):
+        row["id"] = row["id"] * 10
+        return row
+
+    config: RESTAPIConfig = {
+        "client": {
+            "base_url": "https://api.example.com",
+        },
+        "resources": [
+            {
+                "name": "posts",
+                "endpoint": "posts",
+                "processing_steps": [
+                    {"filter": lambda x: x["id"] < 3},  # type: ignore[typeddict-item]
+                    {"filter": lambda x, meta: x["id"] > 1},  # type: ignore[typeddict-item]
+                    {"map": id_plus_1},  # type: ignore[typeddict-item]
+                    {"map": meta_id_by_10},  # type: ignore[typeddict-item]
+                ],
+            },
+            {
+                "name": "posts_no_steps",
+                "endpoint": "posts",
+            },
+        ],
+    }
+    mock_source = rest_api_source(config)
+    # steps that take meta are installed separately
+    no_steps_len = len(mock_source.resources["posts_no_steps"]._pipe)
+    assert len(mock_source.resources["posts"]._pipe) == no_steps_len + 4
+
+    data = list(mock_source.with_resources("posts"))
+    assert len(data) == 1
+    assert data[0]["id"] == 30
+    assert data[0]["title"] == "Post 2"
+
+
 def test_rest_api_source_filtered_child(mock_api_server) -> None:
     config: RESTAPIConfig = {
         "client": {